@@ -1,10 +1,16 @@
 
-import pkg_resources
+from importlib.metadata import entry_points
+
 
 def get_subcommands():
     sc = {}
     er = {}
-    for entry_point in pkg_resources.iter_entry_points('lantz_subcommands'):
+    eps = entry_points()
+    if hasattr(eps, 'select'):
+        eps = eps.select(group='lantz_subcommands')
+    else:
+        eps = eps.get('lantz_subcommands', ())
+    for entry_point in eps:
         try:
             sc[entry_point.name] = entry_point.load()
         except Exception as e:
@@ -13,13 +13,6 @@
     :license: BSD, see LICENSE for more details.
 """
 
-import pkg_resources
-
-try:
-    __version__ = pkg_resources.get_distribution('lantz-core').version
-except:
-    __version__ = "unknown"
-
 from pint import get_application_registry
 ureg = get_application_registry()
 Q_ = ureg.Quantity
@@ -38,16 +31,41 @@ from .processors import DimensionalityWarning
 __all__ = ['Driver', 'Action', 'Feat', 'DictFeat', 'Q_', 'MessageBasedDriver']
 
 
+def __getattr__(name):
+    # PEP 562: the version is resolved on first access, keeping the
+    # distribution metadata machinery off the import critical path.
+    if name == '__version__':
+        from importlib.metadata import version, PackageNotFoundError
+        try:
+            v = version('lantz-core')
+        except PackageNotFoundError:
+            v = 'unknown'
+        globals()['__version__'] = v
+        return v
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+
 def test():
     """Run all tests.
 
+    Requires pytest: parts of the suite are written as pytest tests,
+    which the unittest runner would silently skip or report as import
+    failures.
+
     Parameters
     ----------
 
     Returns
     -------
-    unittest.TestResult
+    pytest exit code
 
     """
-    from .testsuite import run
-    return run()
+    try:
+        import pytest
+    except ImportError:
+        raise ImportError('Running the lantz test suite requires pytest. '
+                          'Install it with: pip install pytest') from None
+
+    import os
+    from . import testsuite
+    return pytest.main([os.path.dirname(testsuite.__file__)])
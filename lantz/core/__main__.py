@@ -1,5 +1,23 @@
 
 
+#: Lazily built argparse parser, shared across config() invocations.
+_PARSER = None
+
+
+def _get_parser():
+    global _PARSER
+    if _PARSER is None:
+        import argparse
+
+        _PARSER = argparse.ArgumentParser(description='Lantz Configuration')
+        _PARSER.add_argument('key', nargs='?', help='Configuration key', default=None)
+        _PARSER.add_argument('value', nargs='?', help='Configuration value', default=None)
+        _PARSER.add_argument('--show-all', action='store_true')
+        _PARSER.add_argument('--show-path', action='store_true')
+
+    return _PARSER
+
+
 def config(args=None):
     """Get or set configuration variables.
 
@@ -9,18 +27,16 @@ def config(args=None):
     $ lantz config core.visa_backend "@py"
     """
 
-    import argparse
     import sys
 
-    from .config import CONFIG_FILE, FULL_CONFIG, cfg
+    from .config import CONFIG_FILE, FULL_CONFIG, read_config_file
 
-    parser = argparse.ArgumentParser(description='Lantz Configuration')
-    parser.add_argument('key', nargs='?', help='Configuration key', default=None)
-    parser.add_argument('value', nargs='?', help='Configuration value', default=None)
-    parser.add_argument('--show-all', action='store_true')
-    parser.add_argument('--show-path', action='store_true')
+    # read_config_file() parses the file once per process and returns the
+    # shared cached parser; a set followed by a get in the same session
+    # still works because the set mutates that shared object.
+    cfg = read_config_file()
 
-    args = parser.parse_args(args)
+    args = _get_parser().parse_args(args)
 
     if args.show_path:
         print('Configuration file: %s' % CONFIG_FILE)
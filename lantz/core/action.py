@@ -11,19 +11,21 @@
 """
 
 from collections import defaultdict
-import inspect
+from inspect import CO_VARARGS, CO_VARKEYWORDS
+import weakref
 
 from pimpmyclass import InstanceConfig
 from pimpmyclass.methods import LockMethod, TransformMethod, StatsMethod, LogMethod, NamedMethod
 
-from .helpers import keep_if_not, MISSING, Self
-from .processors import (Processor,
+from .helpers import keep_if_not, own_registry, MISSING, Self
+from .processors import (fuse,
                          reverse_mapper_or_checker, mapper_or_checker,
                          to_quantity_converter, to_magnitude_converter,
                          range_checker, MyRange)
 
 _NoneType = type(None)
 
+
 class SimMethod(NamedMethod):
 
     _simulator = None
@@ -35,7 +37,82 @@ class SimMethod(NamedMethod):
         return super().call(instance, *args, **kwargs)
 
 
-class Action(LockMethod, TransformMethod, LogMethod, StatsMethod, SimMethod):
+class FastTransformMethod(TransformMethod):
+    """TransformMethod that converts positional arguments through a
+    precomputed flat tuple (one slot per parameter) instead of binding
+    the signature and probing the params dict on every call.
+
+    The table is rebuilt by `Action.on_config_set` whenever the params
+    config changes. Calls using keyword arguments fall back to the
+    generic TransformMethod path.
+    """
+
+    #: Parameter names of the wrapped func, excluding self.
+    _param_names = ()
+
+    #: (converters tuple or None, return converter or None) for the class.
+    _class_converters = None
+
+    #: Same as _class_converters but per instance.
+    _instance_converters = None
+
+    def build_param_table(self, instance, params):
+        # Modifier-less Actions (no params, e.g. initialize/finalize)
+        # must still record a (None, None) table so call() takes the
+        # bypass instead of falling through to the generic path.
+        params = params or {}
+        converters = tuple(params.get(name) for name in self._param_names)
+        if not any(converters):
+            converters = None
+
+        table = (converters, params.get('<ret>'))
+        if instance is None:
+            self._class_converters = table
+        else:
+            if self._instance_converters is None:
+                self._instance_converters = weakref.WeakKeyDictionary()
+            self._instance_converters[instance] = table
+
+    def call(self, instance, *args, **kwargs):
+        if self._instance_converters is not None:
+            table = self._instance_converters.get(instance, self._class_converters)
+        else:
+            table = self._class_converters
+
+        if table is None:
+            return super().call(instance, *args, **kwargs)
+
+        converters, ret_converter = table
+
+        # Actions without any modifier (e.g. initialize, finalize, update,
+        # refresh) skip the transform layer altogether.
+        if converters is None and ret_converter is None:
+            return super(TransformMethod, self).call(instance, *args, **kwargs)
+
+        if kwargs:
+            return super().call(instance, *args, **kwargs)
+
+        if converters and args:
+            try:
+                args = tuple(v if c is None else c(v)
+                             for c, v in zip(converters, args))
+            except Exception as e:
+                instance.log_error('While pre-processing %s for %s: %s', args, self.name, e)
+                raise e
+
+        out = super(TransformMethod, self).call(instance, *args)
+
+        if ret_converter is not None:
+            try:
+                out = ret_converter(out)
+            except Exception as e:
+                instance.log_error('While post-processing %s for %s: %s', out, self.name, e)
+                raise e
+
+        return out
+
+
+class Action(FastTransformMethod, LogMethod, StatsMethod, LockMethod, SimMethod):
     """Wraps a Driver method with Lantz. Can be used as a decorator.
 
     Processors can registered for each arguments to modify their values before
@@ -46,9 +123,11 @@ class Action(LockMethod, TransformMethod, LogMethod, StatsMethod, SimMethod):
     Action has the following nested behaviors:
 
     1. Feat: lantz specific modifiers: values, units, limits, funcs, read_once)
-    2. LockMethod: locks the parent drive (for multi-threading apps)
-    3. TransformMethod: transform values according to predefined rules.
-    4. StatsMethod: record number of calls and timing stats for get/set/failed operations.
+    2. TransformMethod: transform values according to predefined rules.
+    3. StatsMethod: record number of calls and timing stats for get/set/failed operations.
+    4. LockMethod: locks the parent drive (for multi-threading apps).
+       The lock is acquired only around the actual method call so that
+       transforms, logging and stats bookkeeping run lock-free.
     5. Finally the actual method is called.
 
     If a method contains multiple arguments, use the param syntax:
@@ -113,10 +192,26 @@ class Action(LockMethod, TransformMethod, LogMethod, StatsMethod, SimMethod):
     def check_signature(self, func):
         super().check_signature(func)
 
-        names = tuple(inspect.signature(func).parameters.keys())
+        # Reading the code object directly is much cheaper than building
+        # an inspect.Signature and the existing logic only supports plain
+        # positional-or-keyword parameters anyway.
+        code = func.__code__
+        names = code.co_varnames[:code.co_argcount]
+
+        self._param_names = names[1:]
 
         p = self.modifiers.pop(None, None)
 
+        # The table only covers plain positional-or-keyword parameters.
+        # Accepting modifiers on a *args/**kwargs/keyword-only signature
+        # would silently skip the declared conversions, so fail loudly
+        # here instead (the generic path rejects these at call time).
+        if (code.co_flags & (CO_VARARGS | CO_VARKEYWORDS)
+                or code.co_kwonlyargcount):
+            if p or self.modifiers or getattr(func, '__transform_params__', None):
+                raise ValueError('Only named POSITIONAL_OR_KEYWORD arguments are '
+                                 'currently supported by transformations.')
+
         if not p:
             return
 
@@ -130,13 +225,13 @@ class Action(LockMethod, TransformMethod, LogMethod, StatsMethod, SimMethod):
     @classmethod
     def build_converter(cls, values=None, units=None, limits=None, funcs=None):
 
-        p = Processor()
+        steps = []
 
         if values:
-            p.append(mapper_or_checker(values))
+            steps.append(mapper_or_checker(values))
 
         if units:
-            p.append(to_magnitude_converter(units))
+            steps.append(to_magnitude_converter(units))
 
         if limits:
             if isinstance(limits[0], (list, tuple)):
@@ -144,16 +239,15 @@ class Action(LockMethod, TransformMethod, LogMethod, StatsMethod, SimMethod):
             else:
                 proc = range_checker(MyRange(*limits))
 
-            p.append(proc)
+            steps.append(proc)
 
         if funcs:
             if isinstance(funcs, (list, tuple)):
-                for proc in funcs:
-                    p.append(proc)
+                steps.extend(funcs)
             else:
-                p.append(funcs)
+                steps.append(funcs)
 
-        return p
+        return fuse(steps)
 
     @classmethod
     def param(cls, names, *, values=None, units=None, limits=None, funcs=None):
@@ -179,17 +273,12 @@ class Action(LockMethod, TransformMethod, LogMethod, StatsMethod, SimMethod):
 
         # See Feat.__set_name__ for a description of this part
 
-        d = owner._lantz_actions
-
-        if getattr(d, '__lantz_driver_cls__', None) != owner.__qualname__:
-            d = d.__class__(**d)
-            setattr(d, '__lantz_driver_cls__', owner.__qualname__)
-            owner._lantz_actions = d
-
-        owner._lantz_actions[name] = self
+        own_registry(owner, '_lantz_actions')[name] = self
 
         if not name.endswith('_async') and not hasattr(owner, name + '_async'):
-            owner._lantz_actions[name + '_async'] = owner.attach_async(self)
+            lazy = _LazyAsyncAction(self)
+            owner._lantz_actions[name + '_async'] = lazy
+            setattr(owner, name + '_async', lazy)
 
         super().__set_name__(owner, name)
 
@@ -205,6 +294,10 @@ class Action(LockMethod, TransformMethod, LogMethod, StatsMethod, SimMethod):
         """
         super().on_config_set(instance, key, value)
 
+        if key == 'params':
+            self.build_param_table(instance, value)
+            return
+
         if key not in ('modifiers', ):
             return
 
@@ -215,33 +308,74 @@ class Action(LockMethod, TransformMethod, LogMethod, StatsMethod, SimMethod):
                                         for k, v in value.items()})
 
 
+class _LazyAsyncAction:
+    """Placeholder descriptor for the `<name>_async` twin of an Action.
+
+    The real async wrapper (and its _lantz_actions registry entry) is
+    only created on first access, so drivers that never call an Action
+    asynchronously do not pay for the wrapper at class-creation time.
+    """
+
+    __slots__ = ('action',)
+
+    def __init__(self, action):
+        self.action = action
+
+    def materialize(self, owner):
+        # attach_async replaces this descriptor on the owner class.
+        func = owner.attach_async(self.action)
+        own_registry(owner, '_lantz_actions')[self.action.name + '_async'] = func
+        return func
+
+    def __get__(self, instance, owner=None):
+        func = self.materialize(owner if owner is not None else type(instance))
+        if instance is None:
+            return func
+        return func.__get__(instance, owner)
+
+
+#: Attributes reachable through ActionProxy, precomputed per concrete
+#: Action class (subclasses may add their own) so the proxy does a set
+#: membership test instead of a hasattr probe per access.
+_ACTION_ATTRS_CACHE = {}
+
+
+def _action_attrs(action_cls):
+    try:
+        return _ACTION_ATTRS_CACHE[action_cls]
+    except KeyError:
+        return _ACTION_ATTRS_CACHE.setdefault(action_cls, frozenset(dir(action_cls)))
+
+
 class ActionProxy(object):
     """Proxy object for Actions that allows to
     store instance specific modifiers.
     """
 
+    __slots__ = ('instance', 'action')
+
     def __init__(self, instance, action):
         super().__setattr__('instance', instance)
         super().__setattr__('action', action)
 
     def __getattr__(self, item):
 
-        if item in self.action._modifiers:
-            return self.action.modifiers_get(self.instance, item)
+        if item in self.action._config:
+            return self.action.config_get(self.instance, item)
 
-        elif hasattr(self.action, item):
+        elif item in _action_attrs(type(self.action)):
             return getattr(self.action, item)
 
         raise AttributeError('Cannot get %s in %s. '
-                             'Invalid Action method, property or modifier', item, self.action.name)
+                             'Invalid Action method, property or modifier' % (item, self.action.name))
 
     def __setattr__(self, item, value):
 
-        if item not in self.action._modifiers:
+        if item not in self.action._config:
             raise AttributeError('Cannot set %s in %s. '
-                                 'Invalid Action modifier', item, self.feat.name)
+                                 'Invalid Action modifier' % (item, self.action.name))
 
-        self.action.modifiers_set(self.instance, item, value)
+        self.action.config_set(self.instance, item, value)
 
     def param(self, name, *, values=MISSING, units=MISSING, limits=MISSING, funcs=MISSING):
         current = self.action.modifiers_iget(self.instance)
@@ -111,7 +111,24 @@ os.makedirs(CONFIG_FOLDER, exist_ok=True)
 
 CONFIG_FILE = os.path.join(CONFIG_FOLDER, 'config.cfg')
 cfg = configparser.ConfigParser()
-cfg.read(CONFIG_FILE)
+
+#: True if CONFIG_FILE has been parsed into cfg.
+#: Parsing is deferred until a key is not found in the environment,
+#: so runs configured purely via env vars never touch the file.
+_cfg_read = False
+
+#: Snapshot of the LANTZ_* environmental variables, taken once at import
+#: to avoid an os.getenv call per registered key.
+_ENV = {key: val for key, val in os.environ.items() if key.startswith('LANTZ_')}
+
+
+def read_config_file():
+    """Parse the configuration file into cfg if not already done, and return it."""
+    global _cfg_read
+    if not _cfg_read:
+        cfg.read(CONFIG_FILE)
+        _cfg_read = True
+    return cfg
 
 # Configuration Value
 # configuration key -> (source, configuration value)
@@ -126,15 +143,16 @@ FULL_CONFIG = {}
 
 def register_and_get(key, default):
 
-    source, val = 'env', os.getenv('LANTZ_' + key.replace('.', '_').upper(), None)
+    source, val = 'env', _ENV.get('LANTZ_' + key.replace('.', '_').upper(), None)
 
     key = key.lower()
     if val is None:
         section, subkey = key.split('.')
-        try:
-            source, val = 'cfg', cfg[section][subkey]
-        except KeyError:
+        val = read_config_file().get(section, subkey, fallback=None)
+        if val is None:
             source, val = 'mod', default
+        else:
+            source = 'cfg'
 
     FULL_CONFIG[key] = (source, val)
 
@@ -9,6 +9,9 @@
     :license: BSD, see LICENSE for more details.
 """
 
+from .feat import DictFeat
+from .helpers import ALL_INSTANCES, NO_KEY
+
 
 def build_feat_doc(feat):
     """Build the documentation for a given feat.
@@ -26,36 +29,46 @@ def build_feat_doc(feat):
     if not hasattr(feat, '__original_doc__'):
         feat.__original_doc__ = feat.__doc__ or ''
 
-    doc = ''
-    predoc = ''
-
     modifiers = feat.modifiers[ALL_INSTANCES][NO_KEY]
 
+    # Modifier dicts are mutated in place, so fingerprint their content
+    # (not their identity) and skip the rebuild when nothing changed.
+    doc_key = (repr(modifiers['values']), repr(modifiers['units']),
+               repr(modifiers['limits']), len(modifiers['processors'] or ()))
+    if getattr(feat, '__doc_key__', None) == doc_key:
+        return
+
+    parts = []
+    predoc = ''
+
     if isinstance(feat, DictFeat):
         predoc = ':keys: {}\n\n'.format(modifiers.get('keys', None) or 'ANY')
 
     if modifiers['values']:
-        doc += ':values: {}\n'.format(modifiers['values'])
+        parts.append(f":values: {modifiers['values']}\n")
     if modifiers['units']:
-        doc += ':units: {}\n'.format(modifiers['units'])
+        parts.append(f":units: {modifiers['units']}\n")
     if modifiers['limits']:
-        doc += ':limits: {}\n'.format(modifiers['limits'])
+        parts.append(f":limits: {modifiers['limits']}\n")
     if modifiers['processors']:
         docpg = []
         docps = []
         for getp, setp in modifiers['processors']:
             if getp is not None:
-                docpg.insert(0, '  - {}'.format(getp))
+                docpg.insert(0, f'  - {getp}')
             if setp is not None:
-                docps.append('  - {}'.format(setp))
-            if docpg:
-                doc += ':get procs: {}'.format('\n'.join(docpg))
-            if docps:
-                doc += ':set procs: {}'.format('\n'.join(docps))
+                docps.append(f'  - {setp}')
+        if docpg:
+            parts.append(':get procs: {}'.format('\n'.join(docpg)))
+        if docps:
+            parts.append(':set procs: {}'.format('\n'.join(docps)))
+
+    doc = ''.join(parts)
 
     if predoc:
-        predoc = '\n\n{}'.format(predoc)
+        predoc = f'\n\n{predoc}'
     if doc:
-        doc = '\n\n{}'.format(doc)
+        doc = f'\n\n{doc}'
 
     feat.__doc__ = predoc + feat.__original_doc__ + doc
+    feat.__doc_key__ = doc_key
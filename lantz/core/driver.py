@@ -9,7 +9,9 @@
     :license: BSD, see LICENSE for more details.
 """
 
-from collections import defaultdict, ChainMap
+import threading
+
+from collections import defaultdict
 
 from PySignal import ClassSignal
 
@@ -25,10 +27,6 @@ from .log import get_logger
 _REGISTERED = defaultdict(int)
 
 
-class MyDict(dict):
-    pass
-
-
 class Base(ObservableMixin, AsyncMixin, LogMixin, CacheMixin, StorageMixin):
     """Base class for all lantz objects.
 
@@ -56,18 +54,37 @@ class Base(ObservableMixin, AsyncMixin, LogMixin, CacheMixin, StorageMixin):
     _observer_signal_init = ClassSignal
 
     # Dict[str, Feat] relating feat name to Feat instance
-    _lantz_feats = MyDict()
+    _lantz_feats = {}
 
     # Dict[str, DictFeat] relating dictfeat name to DictFeat instance
-    _lantz_dictfeats = MyDict()
+    _lantz_dictfeats = {}
 
     # Dict[str, Action] relating action name to Action instance
-    _lantz_actions = MyDict()
+    _lantz_actions = {}
+
+    # Dict[str, Feat | DictFeat] merging _lantz_feats and _lantz_dictfeats.
+    # Rebuilt in Feat/DictFeat.__set_name__ to avoid a per-instance ChainMap.
+    _lantz_anyfeat = {}
 
     _cache_unset_value = helpers.UNSET
 
+    #: Lock class protecting concurrent access to the driver.
+    #: The default re-entrant lock is required because Actions re-enter
+    #: the lock when they access Feats or other Actions (e.g. refresh).
+    #: Drivers whose Actions never do so can set this to threading.Lock,
+    #: which is noticeably cheaper to acquire when uncontended.
+    _lock_cls = threading.RLock
+
+    __lock = None
+
     __name = ''
 
+    @property
+    def lock(self):
+        if self.__lock is None:
+            self.__lock = self._lock_cls()
+        return self.__lock
+
     def __init__(self, name=None):
         if name:
             self.name = name
@@ -99,7 +116,6 @@ class Base(ObservableMixin, AsyncMixin, LogMixin, CacheMixin, StorageMixin):
                     feat.config_set(None, attr_name, attr_value.default)
 
         super().__init__()
-        self._lantz_anyfeat = ChainMap(self._lantz_feats, self._lantz_dictfeats)
         self.log_info('Created ' + self.name)
 
     @property
@@ -122,20 +138,32 @@ class Base(ObservableMixin, AsyncMixin, LogMixin, CacheMixin, StorageMixin):
         classname = self.__class__.__name__
         return "<{}('{}')>".format(classname, self.name)
 
+    # Proxies are stateless with respect to per-call data, so they are
+    # built once per instance instead of on every attribute access.
+    __feats_proxy = None
+    __dictfeats_proxy = None
+    __actions_proxy = None
+
     @property
     def feats(self):
         """ """
-        return Proxy(self, self._lantz_feats, FeatProxy)
+        if self.__feats_proxy is None:
+            self.__feats_proxy = Proxy(self, self._lantz_feats, FeatProxy)
+        return self.__feats_proxy
 
     @property
     def dictfeats(self):
         """ """
-        return Proxy(self, self._lantz_dictfeats, DictFeatProxy)
+        if self.__dictfeats_proxy is None:
+            self.__dictfeats_proxy = Proxy(self, self._lantz_dictfeats, DictFeatProxy)
+        return self.__dictfeats_proxy
 
     @property
     def actions(self):
         """ """
-        return Proxy(self, self._lantz_actions, ActionProxy)
+        if self.__actions_proxy is None:
+            self.__actions_proxy = Proxy(self, self._lantz_actions, ActionProxy)
+        return self.__actions_proxy
 
 
 class Driver(Base):
@@ -183,11 +211,15 @@ class Driver(Base):
             a dictionary containing the new driver state to be merged with newstate.
         """
 
-        newstate = helpers.merge_dicts(newstate, kwargs)
+        if not newstate:
+            newstate = kwargs
+        elif kwargs:
+            newstate = {**newstate, **kwargs}
+
         if not newstate:
             raise ValueError('update() called with an empty dictionary')
 
-        notfound = set(newstate.keys()) - set(self._lantz_anyfeat.keys())
+        notfound = newstate.keys() - self._lantz_anyfeat.keys()
         if notfound:
             raise ValueError('Not valid feats: %s' % notfound)
 
@@ -223,12 +255,12 @@ class Driver(Base):
             else:
                 raise ValueError('keys must be a (str, list, tuple or dict)')
 
-        # TODO: make this work for DictFeats
-        dfeats = {key: getattr(self, key) for key in self._lantz_feats.keys()
-                  if isinstance(key, str)}
-        ddictfeats = {key: prop.getall(self) for key, prop in self._lantz_dictfeats.items()}
+        # Keys in _lantz_feats always come from __set_name__ and are strings.
+        out = {key: getattr(self, key) for key in self._lantz_feats}
+        for key, prop in self._lantz_dictfeats.items():
+            out[key] = prop.getall(self)
 
-        return {**dfeats, **ddictfeats}
+        return out
 
     def recall(self, keys=None):
         """Return the last value seen for a feat or a collection of feats.
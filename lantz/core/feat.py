@@ -11,6 +11,7 @@
 """
 
 import functools
+import weakref
 
 from collections import defaultdict
 
@@ -20,13 +21,31 @@ from pimpmyclass.props import (LockProperty, ReadOnceProperty, PreventUnnecessar
 from pimpmyclass.dictprops import DictObservableProperty
 
 
-from .helpers import Self, MetaSelf, Proxy
+from .helpers import Self, MetaSelf, Proxy, own_registry
 from .processors import (Processor, to_quantity_converter, to_magnitude_converter,
                          mapper_or_checker, reverse_mapper_or_checker, range_checker, MyRange)
 
 
 _NoneType = type(None)
 
+#: Maps a hashable modifier combination to a (get steps, set steps) pair
+#: of tuples, so instances of the same driver class (or different feats
+#: with equal modifiers) reuse the already-built converter closures.
+_PROCESSOR_CACHE = {}
+
+
+def _modifier_key(values):
+    """Return a hashable stand-in for the values modifier.
+
+    Raises TypeError when the content is not hashable, in which case the
+    caller skips the processor cache.
+    """
+    if isinstance(values, dict):
+        return frozenset(values.items())
+    if isinstance(values, set):
+        return frozenset(values)
+    return values
+
 
 class SimProperty(NamedProperty):
     """A property that with a set or get Lock.
@@ -92,6 +111,45 @@ class Feat(LockProperty, ObservableProperty, PreventUnnecessarySetProperty, Read
     set_funcs = InstanceConfig(default=None,
                                doc='Other callables to be applied to set input argument.')
 
+    #: Modifier fingerprint of the last class-level rebuild, used to skip
+    #: redundant rebuilds when a config write leaves the modifiers unchanged.
+    __last_key = None
+
+    #: Same as __last_key but per instance (lazy WeakKeyDictionary).
+    __instance_keys = None
+
+    #: While True, config writes do not trigger a rebuild. Used by
+    #: _init_after_naming to run a single rebuild instead of one per
+    #: modifier kwarg.
+    _defer_rebuild = False
+
+    def _init_after_naming(self, owner, name, **kwargs):
+        """Run __init__ and __set_name__ as a single step.
+
+        Mixins that only know their modifiers at __set_name__ time (see
+        mfeats) use this to build the processors once, instead of once
+        per modifier kwarg during __init__ and once more on naming.
+        """
+        self._defer_rebuild = True
+        try:
+            Feat.__init__(self, **kwargs)
+        finally:
+            self._defer_rebuild = False
+        Feat.__set_name__(self, owner, name)
+
+    def __get__(self, instance, objtype=None):
+        # Fast path for read_once feats with a warm cache: return the
+        # cached value directly instead of walking the lock, observable,
+        # log and stats layers just to reach ReadOnceProperty's cache
+        # check. The cache read is a single dict lookup, so it is safe
+        # without taking the driver lock.
+        if instance is not None and self.fget is not None and self.read_once_iget(instance):
+            value = self.recall(instance)
+            if value is not instance._cache_unset_value:
+                return value
+
+        return super().__get__(instance, objtype)
+
     def __set_name__(self, owner, name):
         super().__set_name__(owner, name)
 
@@ -99,18 +157,13 @@ class Feat(LockProperty, ObservableProperty, PreventUnnecessarySetProperty, Read
         # This attribute hold the qualname of the Driver subclass in __lantz_driver_cls__
 
         # To allow Driver subclassing, _lantz_feats is duplicated
-        # if the owner class of the property does not match the __lantz_driver_cls__ value.
+        # the first time a Feat is registered in a class that does not
+        # own its registry yet (see helpers.own_registry).
         # In this way, each DriverSubclass._lantz_feats contains only the Feats of DriverSubclass
         # and parent classes but not childs.
 
-        d = owner._lantz_feats
-
-        if getattr(d, '__lantz_driver_cls__', None) != owner.__qualname__:
-            d = d.__class__(**d)
-            setattr(d, '__lantz_driver_cls__', owner.__qualname__)
-            owner._lantz_feats = d
-
-        owner._lantz_feats[name] = self
+        own_registry(owner, '_lantz_feats')[name] = self
+        owner._lantz_anyfeat = {**owner._lantz_feats, **owner._lantz_dictfeats}
 
         self.rebuild()
 
@@ -132,6 +185,9 @@ class Feat(LockProperty, ObservableProperty, PreventUnnecessarySetProperty, Read
         if key not in ('values', 'units', 'limits', 'get_funcs', 'set_funcs'):
             return
 
+        if self._defer_rebuild:
+            return
+
         self.rebuild(instance)
 
     def rebuild(self, instance=None):
@@ -156,33 +212,68 @@ class Feat(LockProperty, ObservableProperty, PreventUnnecessarySetProperty, Read
         get_funcs = self.get_funcs_iget(instance)
         set_funcs = self.set_funcs_iget(instance)
 
-        get_processors = Processor()
-        set_processors = Processor()
-
-        if units:
-            get_processors.append(to_quantity_converter(units))
-            set_processors.append(to_magnitude_converter(units))
-        if values:
-            get_processors.append(reverse_mapper_or_checker(values))
-            set_processors.append(mapper_or_checker(values))
-        if limits:
-            if isinstance(limits[0], (list, tuple)):
-                set_processors.append(range_checker(tuple(MyRange(*l) for l in limits)))
+        try:
+            key = (units, _modifier_key(values), limits,
+                   tuple(get_funcs) if get_funcs else None,
+                   tuple(set_funcs) if set_funcs else None)
+            steps = _PROCESSOR_CACHE.get(key)
+        except TypeError:
+            key = steps = None
+
+        # Redundant config writes (e.g. drivers re-setting defaults during
+        # initialization) leave the modifiers unchanged; keep the current
+        # processors in that case.
+        if key is not None:
+            if instance is None:
+                if key == self.__last_key:
+                    return
+            elif self.__instance_keys is not None and self.__instance_keys.get(instance) == key:
+                return
+
+        if steps is None:
+            get_steps = []
+            set_steps = []
+
+            if units:
+                get_steps.append(to_quantity_converter(units))
+                set_steps.append(to_magnitude_converter(units))
+            if values:
+                get_steps.append(reverse_mapper_or_checker(values))
+                set_steps.append(mapper_or_checker(values))
+            if limits:
+                if isinstance(limits[0], (list, tuple)):
+                    set_steps.append(range_checker(tuple(MyRange(*l) for l in limits)))
+                else:
+                    set_steps.append(range_checker(MyRange(*limits)))
+
+            if get_funcs:
+                for func in get_funcs:
+                    if func is not None:
+                        get_steps.append(Processor(func))
+
+            if set_funcs:
+                for func in set_funcs:
+                    if func is not None:
+                        set_steps.append(Processor(func))
+
+            steps = (tuple(get_steps), tuple(set_steps))
+            if key is not None:
+                _PROCESSOR_CACHE[key] = steps
+
+        get_steps, set_steps = steps
+
+        # Fresh Processor instances per rebuild: Base.__init__ may prepend
+        # per-feat funcs to them, so they cannot be shared between feats.
+        self.post_get_iset(instance, Processor(*reversed(get_steps)))
+        self.pre_set_iset(instance, Processor(*set_steps))
+
+        if key is not None:
+            if instance is None:
+                self.__last_key = key
             else:
-                set_processors.append(range_checker(MyRange(*limits)))
-
-        if get_funcs:
-            for func in get_funcs:
-                if func is not None:
-                    get_processors.append(Processor(func))
-
-        if set_funcs:
-            for func in set_funcs:
-                if func is not None:
-                    set_processors.append(Processor(func))
-
-        self.post_get_iset(instance, reversed(get_processors))
-        self.pre_set_iset(instance, set_processors)
+                if self.__instance_keys is None:
+                    self.__instance_keys = weakref.WeakKeyDictionary()
+                self.__instance_keys[instance] = key
 
 
 class DictFeat(InstanceConfigurableProperty, DictObservableProperty):
@@ -214,19 +305,21 @@ class DictFeat(InstanceConfigurableProperty, DictObservableProperty):
 
     _simulator = None
 
+    def _init_after_naming(self, owner, name, **kwargs):
+        """Run __init__ and __set_name__ as a single step (see
+        Feat._init_after_naming). There is no processor rebuild to defer
+        here: subproperties do not exist yet at this point.
+        """
+        DictFeat.__init__(self, **kwargs)
+        DictFeat.__set_name__(self, owner, name)
+
     def __set_name__(self, owner, name):
         super().__set_name__(owner, name)
 
         # See Feat.__set_name__ for a description of this part
 
-        d = owner._lantz_dictfeats
-
-        if getattr(d, '__lantz_driver_cls__', None) != owner.__qualname__:
-            d = d.__class__(**d)
-            setattr(d, '__lantz_driver_cls__', owner.__qualname__)
-            owner._lantz_dictfeats = d
-
-        owner._lantz_dictfeats[name] = self
+        own_registry(owner, '_lantz_dictfeats')[name] = self
+        owner._lantz_anyfeat = {**owner._lantz_feats, **owner._lantz_dictfeats}
 
     def build_subproperty(self, key, fget, fset, instance=None):
         p = Feat(
@@ -254,7 +347,10 @@ class DictFeat(InstanceConfigurableProperty, DictObservableProperty):
             return
 
         for _, subprop in self._subproperties.items():
-            setattr(subprop, key, value)
+            # Skip subproperties already holding the new value; setattr
+            # would trigger a full rebuild of their processors.
+            if getattr(subprop, key) != value:
+                setattr(subprop, key, value)
 
 
 class FeatProxy:
@@ -262,23 +358,26 @@ class FeatProxy:
     store instance specific modifiers.
     """
 
+    __slots__ = ('instance', 'proxied', '_config_keys')
+
     def __init__(self, instance, feat):
         super().__setattr__('instance', instance)
         super().__setattr__('proxied', feat)
+        super().__setattr__('_config_keys', frozenset(feat._config))
 
     @property
     def __doc__(self):
-        return self.feat.__doc__
+        return self.proxied.__doc__
 
     def __getattr__(self, item):
 
-        if item in self.proxied._config.keys():
+        if item in self._config_keys:
             return self.proxied.config_get(self.instance, item)
 
         elif hasattr(self.proxied, item):
             out = getattr(self.proxied, item)
             if callable(out):
-                return functools.partial(getattr(self.proxied, item), self.instance)
+                return functools.partial(out, self.instance)
             return out
 
         raise AttributeError('Cannot get %s in %s. '
@@ -286,7 +385,7 @@ class FeatProxy:
 
     def __setattr__(self, item, value):
 
-        if item not in self.proxied._config.keys():
+        if item not in self._config_keys:
             raise AttributeError('Cannot set %s in %s. '
                                  'Invalid Feat modifier', item, self.proxied.name)
 
@@ -298,9 +397,13 @@ class DictFeatProxy:
     store instance specific modifiers.
     """
 
+    __slots__ = ('instance', 'proxied', '_config_keys', '_item_cache')
+
     def __init__(self, instance, dictfeat):
         super().__setattr__('instance', instance)
         super().__setattr__('proxied', dictfeat)
+        super().__setattr__('_config_keys', frozenset(dictfeat._config))
+        super().__setattr__('_item_cache', {})
 
     @property
     def __doc__(self):
@@ -308,13 +411,13 @@ class DictFeatProxy:
 
     def __getattr__(self, item):
 
-        if item in self.proxied._config.keys():
+        if item in self._config_keys:
             return self.proxied.config_get(self.instance, item)
 
         elif hasattr(self.proxied, item):
             out = getattr(self.proxied, item)
             if callable(out):
-                return functools.partial(getattr(self.proxied, item), self.instance)
+                return functools.partial(out, self.instance)
             return out
 
         raise AttributeError('Cannot get %s in %s. '
@@ -322,25 +425,46 @@ class DictFeatProxy:
 
     def __setattr__(self, item, value):
 
-        if item not in self.proxied._config.keys():
+        if item not in self._config_keys:
             raise AttributeError('Cannot set %s in %s. '
                                  'Invalid DictFeat modifier', item, self.proxied.name)
 
         self.proxied.config_set(self.instance, item, value)
 
     def __getitem__(self, item):
-        return FeatProxy(self.instance, self.proxied.subproperty(self.instance, item))
+        # Subproperties are stable per key, so the FeatProxy wrapping
+        # each of them can be reused across accesses.
+        subprop = self.proxied.subproperty(self.instance, item)
+        cached = self._item_cache.get(item)
+        if cached is not None and cached.proxied is subprop:
+            return cached
+
+        proxy = FeatProxy(self.instance, subprop)
+        self._item_cache[item] = proxy
+        return proxy
 
 
 class TypedFeat(Feat):
 
     def __init__(self, valid_types, *args, **kwargs):
+        if not isinstance(valid_types, tuple):
+            if isinstance(valid_types, (list, set)):
+                valid_types = tuple(valid_types)
+            else:
+                valid_types = (valid_types, )
         self.valid_types = valid_types
-        super().__init__(fget=self.local_get, fset=self.local_set, *args, **kwargs)
+
+        # The setter runs on every set operation; binding the type tuple
+        # in a closure avoids the attribute loads on the hot path.
+        feat = self
+
+        def local_set(instance, value):
+            if not isinstance(value, valid_types):
+                raise TypeError('Only {} are valid types for {}, not {}'.format(
+                    valid_types, feat.name, value))
+
+        self.local_set = local_set
+        super().__init__(fget=self.local_get, fset=local_set, *args, **kwargs)
 
     def local_get(self, instance):
         return self.recall(instance)
-
-    def local_set(self, instance, value):
-        if not isinstance(value, self.valid_types):
-            raise Exception('Only {} are valid types for {}, not {}'.format(self.valid_types, self.name, value))
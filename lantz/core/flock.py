@@ -10,8 +10,7 @@
 """
 
 import atexit
-
-import serialize
+import functools
 
 from collections import defaultdict
 from concurrent import futures
@@ -35,6 +34,11 @@ class Flock:
         self._dependencies = defaultdict(set)
         self._state = defaultdict(dict)
 
+        # Topological groups computed by solve_dependencies, invalidated
+        # whenever a driver is added so repeated initialize/finalize
+        # cycles pay for the sort only once.
+        self._dep_groups_cache = None
+
     def add(self, driver, *dependencies):
         """Add a non instantiated driver to the flock.
 
@@ -56,6 +60,13 @@ class Flock:
             raise ValueError('%s is not a valid driver name within a flock. '
                              'Must be a valid python identifier.' % name)
 
+        # Underscore names are reserved: the driver is also bound as an
+        # instance attribute below and must not clobber the flock
+        # internals (_drivers, _dependencies, _state, ...).
+        if name.startswith('_'):
+            raise ValueError('%s is not a valid driver name within a flock. '
+                             'Must not start with an underscore.' % name)
+
         if name in dir(Flock):
             raise ValueError('%s is not a valid driver name within a flock. '
                              'Must be different from %s' % (name, dir(Flock)))
@@ -64,27 +75,52 @@ class Flock:
             raise ValueError('%s is already taken within this flock')
 
         self._drivers[name] = driver
+
+        # Also bind the driver as a plain instance attribute so flock.name
+        # is resolved by the normal lookup without entering __getattr__.
+        # Class attributes and underscore names were ruled out above.
+        self.__dict__[name] = driver
+
         for dep in dependencies:
             self._dependencies[name].add(dep)
 
+        self._dep_groups_cache = None
+
     @property
     def dependencies(self):
         return MappingProxyType(self._dependencies)
 
+    def _dep_groups(self):
+        """Return the memoized topological groups for the current flock.
+        """
+        if self._dep_groups_cache is None:
+            # solve_dependencies builds its own working copy.
+            self._dep_groups_cache = helpers.solve_dependencies(
+                self._dependencies, set(self._drivers.keys()))
+        return self._dep_groups_cache
+
     def __iter__(self):
-        yield from self.values()
+        return iter(self._drivers.values())
+
+    # Dict views are cheaper than generator wrappers and support
+    # len() and containment checks directly.
 
     def items(self):
-        yield from self._drivers.items()
+        return self._drivers.items()
 
     def keys(self):
-        yield from self._drivers.keys()
+        return self._drivers.keys()
 
     def values(self):
-        yield from self._drivers.values()
+        return self._drivers.values()
 
     def __getattr__(self, item):
-        return self._drivers[item]
+        # Only reached for names not set in add(); translate to
+        # AttributeError so hasattr and introspection work as expected.
+        try:
+            return self._drivers[item]
+        except KeyError:
+            raise AttributeError(item) from None
 
     def initialize(self, register_finalizer=False, on_initializing=None,
                    on_initialized=None, on_exception=None, concurrent=False):
@@ -111,7 +147,8 @@ class Flock:
 
         return initialize_many(self.values(), register_finalizer, on_initializing,
                                on_initialized, on_exception, concurrent,
-                               dict(self._dependencies))
+                               self._dependencies,
+                               _precomputed_groups=self._dep_groups())
 
     def finalize(self, on_finalizing=None, on_finalized=None, on_exception=None,
                  concurrent=False):
@@ -136,7 +173,8 @@ class Flock:
 
         return finalize_many(self.values(), on_finalizing, on_finalized,
                              on_exception, concurrent,
-                             dict(self._dependencies))
+                             self._dependencies,
+                             _precomputed_groups=self._dep_groups())
 
     @classmethod
     def parse(cls, flock, source):
@@ -160,6 +198,10 @@ class Flock:
 
     @classmethod
     def from_yaml(cls, filename):
+        # Imported here so that orchestrating a flock without YAML
+        # does not pay for the serialize import at startup.
+        import serialize
+
         source = serialize.load(filename)
 
         f = Flock()
@@ -167,6 +209,9 @@ class Flock:
         return cls.parse(f, source)
 
     def to_yaml(self, filename):
+        # See from_yaml.
+        import serialize
+
         if not filename.endswith('.yaml'):
             filename += filename + '.yaml'
 
@@ -200,7 +245,7 @@ class Flock:
     def recall(self):
         """Return the last value seen for each feat for each driver in the flock.
         """
-        return {name: driver for name, driver in self}
+        return dict(self._drivers)
 
     def restore_state(self, state=None):
         """Restore a state.
@@ -228,9 +273,31 @@ class Flock:
         self.finalize()
 
 
+def _on_done(driver, on_success, on_exception, fut):
+    """Future callback shared by concurrent initialization and finalization.
+    """
+    ex = fut.exception()
+    if ex:
+        if not on_exception:
+            raise ex
+        on_exception(driver, ex)
+    else:
+        if on_success:
+            on_success(driver)
+
+
+def _register_finalizer(driver, finalizer_list, fut):
+    finalizer_list.append(driver)
+
+
+def _finalize_all(finalizer_list):
+    for driver in finalizer_list:
+        driver.finalize()
+
+
 def initialize_many(drivers, register_finalizer=True,
                     on_initializing=None, on_initialized=None, on_exception=None,
-                    concurrent=False, dependencies=None):
+                    concurrent=False, dependencies=None, _precomputed_groups=None):
     """Initialize a group of drivers.
 
     Parameters
@@ -262,7 +329,11 @@ def initialize_many(drivers, register_finalizer=True,
     if dependencies:
         names = {driver.name: driver for driver in drivers}
 
-        groups = helpers.solve_dependencies(dependencies, set(names.keys()))
+        # Callers that initialize repeatedly (e.g. Flock) can pass the
+        # already solved groups to skip the topological sort.
+        groups = _precomputed_groups
+        if groups is None:
+            groups = helpers.solve_dependencies(dependencies, set(names.keys()))
         drivers = tuple(tuple(names[name] for name in group) for group in groups)
         for subset in drivers:
             initialize_many(subset, register_finalizer,
@@ -271,22 +342,9 @@ def initialize_many(drivers, register_finalizer=True,
         return
 
     if concurrent:
-        def _finalize(d):
-            def _inner_finalize(f):
-                atexit.register(d.finalize)
-            return _inner_finalize
-
-        def _done(d):
-            def _inner(f):
-                ex = f.exception()
-                if ex:
-                    if not on_exception:
-                        raise ex
-                    on_exception(d, ex)
-                else:
-                    if on_initialized:
-                        on_initialized(d)
-            return _inner
+        # One finalizer list registered with atexit once, instead of one
+        # atexit.register (which takes a lock) per driver.
+        finalizer_list = [] if register_finalizer else None
 
         futs = []
         for driver in drivers:
@@ -294,10 +352,15 @@ def initialize_many(drivers, register_finalizer=True,
                 on_initializing(driver)
             fut = driver.initialize_async()
             if register_finalizer:
-                fut.add_done_callback(_finalize(driver))
-            fut.add_done_callback(_done(driver))
+                fut.add_done_callback(
+                    functools.partial(_register_finalizer, driver, finalizer_list))
+            fut.add_done_callback(
+                functools.partial(_on_done, driver, on_initialized, on_exception))
             futs.append(fut)
 
+        if register_finalizer:
+            atexit.register(_finalize_all, finalizer_list)
+
         futures.wait(futs)
     else:
         for driver in drivers:
@@ -319,7 +382,7 @@ def initialize_many(drivers, register_finalizer=True,
 
 def finalize_many(drivers,
                   on_finalizing=None, on_finalized=None, on_exception=None,
-                  concurrent=False, dependencies=None):
+                  concurrent=False, dependencies=None, _precomputed_groups=None):
     """Finalize a group of drivers.
 
     Parameters
@@ -350,31 +413,23 @@ def finalize_many(drivers,
     if dependencies:
         names = {driver.name: driver for driver in drivers}
 
-        groups = helpers.solve_dependencies(dependencies, set(names.keys()))
+        # See initialize_many.
+        groups = _precomputed_groups
+        if groups is None:
+            groups = helpers.solve_dependencies(dependencies, set(names.keys()))
         drivers = tuple(tuple(names[name] for name in group) for group in groups)
         for subset in reversed(drivers):
             finalize_many(subset, on_finalizing, on_finalized, on_exception, concurrent)
         return
 
     if concurrent:
-        def _done(d):
-            def _inner(f):
-                ex = f.exception()
-                if ex:
-                    if not on_exception:
-                        raise ex
-                    on_exception(d, ex)
-                else:
-                    if on_finalized:
-                        on_finalized(d)
-            return _inner
-
         futs = []
         for driver in drivers:
             if on_finalizing:
                 on_finalizing(driver)
             fut = driver.finalize_async()
-            fut.add_done_callback(_done(driver))
+            fut.add_done_callback(
+                functools.partial(_on_done, driver, on_finalized, on_exception))
             futs.append(fut)
 
         futures.wait(futs)
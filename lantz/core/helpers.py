@@ -11,15 +11,20 @@
 """
 
 
-from collections import UserDict
+import functools
+
+from collections import defaultdict
 
 
 class NamedObject(object):
     """A class to construct named sentinels.
     """
 
+    __slots__ = ('name', '_hash')
+
     def __init__(self, name):
         self.name = name
+        self._hash = id(self)
 
     def __repr__(self):
         return self.name
@@ -28,7 +33,7 @@ class NamedObject(object):
         return self.name
 
     def __hash__(self):
-        return id(self)
+        return self._hash
 
     def __deepcopy__(self, memo):
         return self
@@ -46,8 +51,11 @@ NO_KEY = NamedObject('NO_KEY')
 
 
 
-class UnsetDict(UserDict):
-    """Dictionary that returns UNSET
+class UnsetDict(dict):
+    """Dictionary that returns UNSET for missing keys.
+
+    Subclasses dict directly (not UserDict) so lookups stay on the
+    C-level fast path.
     """
     def __missing__(self, key):
         return UNSET
@@ -76,12 +84,17 @@ def merge_dicts(*args):
     {a: 1, b: 3, c: 4}
     """
 
-    args = (arg for arg in args if arg)
+    # The typical call merges two dicts; unpacking is a single
+    # C-level expression for that case.
+    if len(args) == 2:
+        a, b = args
+        return {**(a or {}), **(b or {})}
 
     out = {}
 
     for arg in args:
-        out.update(arg)
+        if arg:
+            out.update(arg)
 
     return out
 
@@ -90,6 +103,39 @@ def keep_if_not(_skip=None, **kwargs):
     return {k: v for k, v in kwargs.items() if v is not _skip}
 
 
+def own_registry(owner, attr_name):
+    """Return the registry dict stored in the owner class under attr_name,
+    copying the one inherited from the parent class on the first write
+    for each class.
+
+    Registries are plain dicts (subclassing dict would disable CPython's
+    specialized lookup paths on the hottest Driver dicts), so ownership
+    is marked with a per-registry flag in the owner class __dict__, which
+    is not inherited by subclasses.
+
+    Parameters
+    ----------
+    owner : type
+        The driver class being constructed.
+    attr_name : str
+        Name of the registry attribute (e.g. '_lantz_feats').
+
+    Returns
+    -------
+    dict
+
+    """
+    d = getattr(owner, attr_name)
+
+    marker = '__lantz_own' + attr_name
+    if marker not in owner.__dict__:
+        d = dict(d)
+        setattr(owner, attr_name, d)
+        setattr(owner, marker, True)
+
+    return d
+
+
 def solve_dependencies(dependencies, all_members=None):
     """Solve a dependency graph.
 
@@ -105,26 +151,58 @@ def solve_dependencies(dependencies, all_members=None):
 
     Returns
     -------
-    list of sets
-        Each set contains tasks that depend only on the tasks
-        in the previous set in the list.
+    list of tuples
+        Each tuple contains tasks that depend only on the tasks in the
+        previous tuple in the list, sorted for deterministic iteration.
 
     """
-    d = dict((key, set(value)) for key, value in dependencies.items())
+    # Common case: no edges at all, everything fits in a single layer.
+    if all(not deps for deps in dependencies.values()):
+        members = set(dependencies)
+        if all_members:
+            members.update(all_members)
+        return [tuple(sorted(members))] if members else []
+
+    # Kahn's algorithm: build the reverse adjacency map and in-degree
+    # counter once, then drain nodes whose in-degree reaches zero.
+
+    rev = defaultdict(set)
+    indeg = {}
+
+    for key, deps in dependencies.items():
+        deps = set(deps)
+        indeg[key] = len(deps)
+        for dep in deps:
+            rev[dep].add(key)
+
+    for node in rev:
+        if node not in indeg:
+            indeg[node] = 0
 
     if all_members:
-        d.update({key: set() for key in all_members if key not in d})
-    r = []
+        for node in all_members:
+            if node not in indeg:
+                indeg[node] = 0
 
-    while d:
-        # values not in keys (items without dep)
-        t = set(i for v in d.values() for i in v) - set(d.keys())
-        # and keys without value (items without dep)
-        t.update(k for k, v in d.items() if not v)
-        # can be done right away
-        r.append(t)
-        # and cleaned up
-        d = dict(((k, v - t) for k, v in d.items() if v))
+    r = []
+    ready = {node for node, count in indeg.items() if count == 0}
+
+    while ready:
+        r.append(tuple(sorted(ready)))
+        next_ready = set()
+        for node in ready:
+            for dependent in rev.get(node, ()):
+                indeg[dependent] -= 1
+                if indeg[dependent] == 0:
+                    next_ready.add(dependent)
+        ready = next_ready
+
+    # Nodes never drained are part of (or depend on) a cycle; dropping
+    # them silently would corrupt the startup ordering.
+    if sum(len(layer) for layer in r) != len(indeg):
+        cyclic = sorted(node for node, count in indeg.items() if count > 0)
+        raise ValueError('Cyclic dependencies exist among these items: {}'.format(
+            ', '.join(repr(node) for node in cyclic)))
 
     return r
 
@@ -150,17 +228,24 @@ def tuplify(a, n):
 
 
 def tuplify_many(*args_item):
-    lens = [lengther(arg) for arg, item in args]
-    mx = max(val for val in lens if val is not None)
-    mn = min(val for val in lens if val is not None)
-    if mx != mn:
-        raise ValueError('All tuples must be the same length '
-                         'when specifing multiple modifiers.')
-
-    if mx == 0:
-        return args
-
-
+    # Single pass: track the first concrete length and compare the rest
+    # against it (the old version referenced an undefined name and
+    # aggregated max/min in two extra passes).
+    first = None
+    for arg in args_item:
+        n = lengther(arg)
+        if n is None:
+            continue
+        if first is None:
+            first = n
+        elif n != first:
+            raise ValueError('All tuples must be the same length '
+                             'when specifing multiple modifiers.')
+
+    return args_item
+
+
+@functools.lru_cache(maxsize=None)
 def import_from_entrypoint(object_ref):
     import importlib
     modname, qualname_separator, qualname = object_ref.partition(':')
@@ -172,11 +257,19 @@ def import_from_entrypoint(object_ref):
     return obj
 
 
+#: Default-less Self instances per attribute name. They are immutable
+#: (Self.__call__ returns a clone) so sharing them is safe.
+_SELF_CACHE = {}
+
+
 class MetaSelf(type):
     """Metaclass for Self object"""
 
     def __getattr__(self, item):
-        return Self(item)
+        try:
+            return _SELF_CACHE[item]
+        except KeyError:
+            return _SELF_CACHE.setdefault(item, Self(item))
 
 
 class Self(metaclass=MetaSelf):
@@ -197,8 +290,9 @@ class Self(metaclass=MetaSelf):
         return getattr(instance, self.item)
 
     def __call__(self, default_value):
-        self.default = default_value
-        return self
+        # Return a clone so the default-less instances cached by
+        # MetaSelf are never mutated.
+        return Self(self.item, default_value)
 
     def __repr__(self):
         return "<Self.{}('{}')>".format(self.item, self.default)
@@ -207,24 +301,44 @@ class Self(metaclass=MetaSelf):
 class Proxy(object):
     """Read only dictionary that maps feat name to Proxy objects"""
 
+    __slots__ = ('instance', 'collection', 'callable', '_cache', '_get')
+
     def __init__(self, instance, collection, callable):
         self.instance = instance
         self.collection = collection
         self.callable = callable
 
+        # item name -> (proxied object, proxy), so repeated accesses reuse
+        # the proxy as long as the registry entry has not been replaced.
+        self._cache = {}
+
+        # Bound lookup on the registry, saving two attribute loads
+        # per access.
+        self._get = collection.__getitem__
+
     def __contains__(self, item):
         return item in self.collection
 
+    def _proxy_for(self, item):
+        value = self._get(item)
+        cached = self._cache.get(item)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+
+        proxy = self.callable(self.instance, value)
+        self._cache[item] = (value, proxy)
+        return proxy
+
     def __getattr__(self, item):
-        return self.callable(self.instance, self.collection[item])
+        return self._proxy_for(item)
 
     def __getitem__(self, item):
-        return self.callable(self.instance, self.collection[item])
+        return self._proxy_for(item)
 
     def items(self):
         """ """
-        for key, value in self.collection.items():
-            yield key, self.callable(self.instance, value)
+        for key in self.collection.keys():
+            yield key, self._proxy_for(key)
 
     def keys(self):
         """ """
@@ -9,37 +9,94 @@
     :license: BSD, see LICENSE for more details.
 """
 
-from collections import ChainMap
+import functools
+import logging
+import sys
 import types
 
-import pyvisa as visa
-
 from .errors import NotSupportedError, NotInitializedError
 from .driver import Driver
 from .feat import Feat
 from . import processors
 
 
-#: Cache of parsing functions.
-#: :type: dict[str, processors.parser]
-_PARSERS_CACHE = {}
+#: Cache of resource info per resource name, to avoid asking the VISA
+#: backend again when several drivers share the same resource name.
+#: :type: dict[str, object]
+_RESOURCE_INFO_CACHE = {}
+
+#: PyVISA module, imported on first use so that loading lantz does not
+#: pay for the ctypes bindings unless VISA is actually needed.
+_visa = None
 
 #: PyVISA Resource Manager used in Lantz
-#: :type: visa.ResourceManager
+#: :type: pyvisa.ResourceManager
 _resource_manager = None
 
 
+def _get_visa():
+    """Import and return the pyvisa module, caching the reference."""
+    global _visa
+    if _visa is None:
+        import pyvisa
+        _visa = pyvisa
+    return _visa
+
+
 def get_resource_manager():
     """Return the PyVISA Resource Manager, creating an instance if necessary."""
     global _resource_manager
     if _resource_manager is None:
         from . import config
-        _resource_manager = visa.ResourceManager(config.VISA_BACKEND)
+        _resource_manager = _get_visa().ResourceManager(config.VISA_BACKEND)
     return _resource_manager
 
 
+@functools.lru_cache(maxsize=256)
+def _get_parser(fmt):
+    """Return the parsing function for a format string, memoized with a
+    bounded cache since format strings come from driver code.
+    """
+    return processors.parser(fmt)
+
+
+def _defaults_for(cls, instrument_type, resource_type):
+    """Flatten cls.DEFAULTS for the given interface.
+
+    Results are memoized per class in cls._defaults_merged, so callers
+    must not mutate the returned dict.
+    """
+
+    maps = []
+
+    for key in ((instrument_type, resource_type), instrument_type, resource_type, 'COMMON'):
+        if key not in cls.DEFAULTS:
+            continue
+        value = cls.DEFAULTS[key]
+        if value is None:
+            raise NotSupportedError('An %s instrument is not supported by the driver %s',
+                                    key, cls.__name__)
+        if value:
+            maps.append(value)
+
+    # Low precedence first; later updates win, matching the old
+    # ChainMap semantics without its per-key lookup chain.
+    out = {}
+    for m in reversed(maps):
+        out.update(m)
+
+    return out
+
+
 class UninitializedResource:
 
+    # Common entry points dispatch directly instead of paying for the
+    # full attribute-miss protocol before raising.
+    def _raise(self, *args, **kwargs):
+        raise NotInitializedError
+
+    write = read = query = close = _raise
+
     def __getattr__(self, item):
         raise NotInitializedError
 
@@ -88,6 +145,21 @@ class MessageBasedDriver(Driver):
     #: :type: visa.ResourceManager
     __resource_manager = None
 
+    #: Read-only view of DEFAULTS shared by all instances of the class.
+    _DEFAULTS_PROXY = types.MappingProxyType({})
+
+    #: Per-class memo of merged DEFAULTS keyed by
+    #: (instrument type, resource type), filled on first use.
+    _defaults_merged = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Built once per class; instances only take a reference to it
+        # (see __init__).
+        cls._DEFAULTS_PROXY = types.MappingProxyType(cls.DEFAULTS or {})
+        cls._defaults_merged = {}
+
     @classmethod
     def _get_defaults_kwargs(cls, instrument_type, resource_type, **user_kwargs):
         """Compute the default keyword arguments combining:
@@ -110,20 +182,16 @@ class MessageBasedDriver(Driver):
         """
 
         if cls.DEFAULTS:
+            key = (instrument_type, resource_type)
+            defaults = cls._defaults_merged.get(key)
+            if defaults is None:
+                defaults = cls._defaults_merged[key] = _defaults_for(
+                    cls, instrument_type, resource_type)
 
-            maps = [user_kwargs] if user_kwargs else []
+            if not user_kwargs:
+                return defaults.copy()
 
-            for key in ((instrument_type, resource_type), instrument_type, resource_type, 'COMMON'):
-                if key not in cls.DEFAULTS:
-                    continue
-                value = cls.DEFAULTS[key]
-                if value is None:
-                    raise NotSupportedError('An %s instrument is not supported by the driver %s',
-                                            key, cls.__name__)
-                if value:
-                    maps.append(value)
-
-            return dict(ChainMap(*maps))
+            return {**defaults, **user_kwargs}
         else:
             return user_kwargs
 
@@ -190,8 +258,9 @@ class MessageBasedDriver(Driver):
 
         if _models:
             # There are more than 1 model compatible with
+            _models = frozenset(_models)
             resource_names = [r for r in resource_names
-                              if r.split('::')[2] in _models]
+                              if r.split('::', 3)[2] in _models]
 
             if not resource_names:
                 raise ValueError('No USBTMC devices found for %s '
@@ -380,17 +449,24 @@ class MessageBasedDriver(Driver):
         :param kwargs: keyword arguments passed to the resource during initialization.
         """
 
+        # Resource names are repeated across instances and cache keys;
+        # interning dedupes the string objects and speeds up dict lookups.
+        resource_name = sys.intern(resource_name)
+
         self.__resource_manager = get_resource_manager()
         try:
             if not resource_name == 'dummy':
-                resource_info = self.__resource_manager.resource_info(resource_name)
-        except visa.VisaIOError:
+                resource_info = _RESOURCE_INFO_CACHE.get(resource_name)
+                if resource_info is None:
+                    resource_info = self.__resource_manager.resource_info(resource_name)
+                    _RESOURCE_INFO_CACHE[resource_name] = resource_info
+        except _visa.VisaIOError:
             raise ValueError('The resource name is invalid')
 
         super().__init__(name=name)
 
         # This is to avoid accidental modifications of the class value by an instance.
-        self.DEFAULTS = types.MappingProxyType(self.DEFAULTS or {})
+        self.DEFAULTS = type(self)._DEFAULTS_PROXY
 
         #: The resource name
         #: :type: str
@@ -411,8 +487,13 @@ class MessageBasedDriver(Driver):
 
         self.log_debug('Using MessageBasedDriver for {}', self.resource_name)
 
+    #: Snapshot of logger.isEnabledFor(DEBUG), taken at initialize time
+    #: so write/read do not format reprs when debug logging is off.
+    _log_debug_enabled = True
+
     def initialize(self):
         super().initialize()
+        self._log_debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         self.log_debug('Opening resource {}', self.resource_name)
         self.log_debug('Setting {}', list(self.resource_kwargs.items()))
         if not self.resource_name == 'dummy':
@@ -438,6 +519,8 @@ class MessageBasedDriver(Driver):
             termination, encoding) to override class defaults
         """
 
+        # Dispatch through self.write/self.read: subclasses override them
+        # to customize the wire protocol (checksums, extra logging, ...).
         self.write(command, *send_args)
         return self.read(*recv_args)
 
@@ -454,8 +537,7 @@ class MessageBasedDriver(Driver):
         """
         ans = self.query(command, send_args=send_args, recv_args=recv_args)
         if format:
-            parser = _PARSERS_CACHE.setdefault(format, processors.parser(format))
-            ans = parser(ans)
+            ans = _get_parser(format)(ans)
         return ans
 
     def write(self, command, termination=None, encoding=None):
@@ -478,7 +560,8 @@ class MessageBasedDriver(Driver):
             number of bytes sent.
 
         """
-        self.log_debug('Writing {!r}', command)
+        if self._log_debug_enabled:
+            self.log_debug('Writing {!r}', command)
         return self.resource.write(command, termination, encoding)
 
     def read(self, termination=None, encoding=None):
@@ -498,5 +581,6 @@ class MessageBasedDriver(Driver):
 
         """
         ret = self.resource.read(termination, encoding)
-        self.log_debug('Read {!r}', ret)
+        if self._log_debug_enabled:
+            self.log_debug('Read {!r}', ret)
         return ret
@@ -10,32 +10,44 @@
 """
 
 import collections
+import functools
 from string import Formatter
 
 from .feat import Feat, DictFeat
 
 
+#: Successfully checked (format string, values, msg) combinations, so
+#: repeated declarations of the same command template skip the
+#: try/format/except probe (see check_values).
+_CHECKED_VALUES = set()
+
+
+#: Shared template for spec-less fields.
+_EMPTY_BRACES = '{}'
+
+
 def to_brackets(field_name, format_spec):
     """Return PEP 3101 format string with field name and format specification.
     """
 
     if format_spec:
-        format_spec = ':' + format_spec
-        return '{' + field_name + format_spec + '}'
+        return f'{{{field_name}:{format_spec}}}'
 
-    return '{' + field_name + '}'
+    return f'{{{field_name}}}'
 
 
+@functools.lru_cache(maxsize=None)
 def to_spec_brackets(format_spec):
     """Return PEP 3101 format string with format specification.
     """
 
     if format_spec:
-        return '{' + ':' + format_spec + '}'
+        return f'{{:{format_spec}}}'
 
-    return '{}'
+    return _EMPTY_BRACES
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_cmd(format_string):
     """Parse a format string and return a dictionary linking field name to PEP 3101 with format specification.
     (Removes field names)
@@ -46,13 +58,109 @@ def parse_cmd(format_string):
 
 
 def check_values(format_string, values, msg):
-    """Tries to format a given string for all values
+    """Tries to format a given string for all values.
+
+    The template is parsed once and each value is probed through
+    ``format(value, spec)`` directly, avoiding str.format's per-call
+    template parsing. Empty specs accept any object, so they are not
+    probed at all.
+    """
+    try:
+        key = (format_string, tuple(values), msg)
+        if key in _CHECKED_VALUES:
+            return
+    except TypeError:
+        key = None
+
+    specs = tuple(spec for _, name, spec, _ in Formatter().parse(format_string)
+                  if name is not None and spec)
+
+    for spec in specs:
+        for value in values:
+            try:
+                format(value, spec)
+            except (ValueError, TypeError) as e:
+                raise ValueError("Could not format the '%s' into %s'.\n%s" % (value, msg, e))
+
+    if key is not None:
+        _CHECKED_VALUES.add(key)
+
+
+class _KeyedDefaultDict(collections.defaultdict):
+    """defaultdict restricted to a fixed key set.
+
+    Values are produced by the default factory on first read, so
+    DictFeats with many keys do not allocate one scalar per key at
+    class-construction time. Unknown keys raise KeyError as a plain
+    dict would.
+    """
+
+    def __init__(self, default_factory, valid_keys):
+        super().__init__(default_factory)
+        self._valid_keys = frozenset(valid_keys)
+
+    def __missing__(self, key):
+        if key not in self._valid_keys:
+            raise KeyError(key)
+        value = self.default_factory()
+        self[key] = value
+        return value
+
+
+def _compile_value_format(format_string):
+    """Compile a single-field positional template into a closure.
+
+    str.format re-parses the template on every call; for the common
+    'prefix {spec} suffix' shape plain concatenation is much cheaper.
+    Templates with conversions, named fields or several fields fall back
+    to the bound format method.
     """
-    for value in values:
-        try:
-            format_string.format(value)
-        except Exception as e:
-            raise ValueError("Could not format the '%s' into %s'.\n%s" % (value, msg, e))
+    parts = list(Formatter().parse(format_string))
+    fields = [(name, spec, conv) for _, name, spec, conv in parts if name is not None]
+
+    if len(fields) != 1 or fields[0][0] not in ('', '0') or fields[0][2]:
+        return format_string.format
+
+    prefix = parts[0][0]
+    spec = fields[0][1] or ''
+    suffix = ''.join(lit for lit, _, _, _ in parts[1:])
+
+    if spec:
+        def run(value, _p=prefix, _s=spec, _x=suffix):
+            return _p + format(value, _s) + _x
+    else:
+        def run(value, _p=prefix, _x=suffix):
+            return _p + str(value) + _x
+
+    return run
+
+
+def _compile_key_value_format(format_string):
+    """Compile a template with 'key' and/or 'value' fields into a
+    two-argument closure. Templates with conversions fall back to
+    str.format.
+    """
+    parts = list(Formatter().parse(format_string))
+
+    if any(conv for _, _, _, conv in parts):
+        def run(key, value, _fmt=format_string):
+            return _fmt.format(key=key, value=value)
+        return run
+
+    compiled = tuple((lit, name, spec or '') for lit, name, spec, _ in parts)
+
+    def run(key, value, _compiled=compiled):
+        out = []
+        for lit, name, spec in _compiled:
+            if lit:
+                out.append(lit)
+            if name == 'key':
+                out.append(format(key, spec))
+            elif name == 'value':
+                out.append(format(value, spec))
+        return ''.join(out)
+
+    return run
 
 
 class MFeatMixin:
@@ -69,10 +177,33 @@ class MFeatMixin:
         self.set_cmd = set_cmd
 
     def __set_name__(self, owner, name):
+        # The type of get_cmd/set_cmd is fixed per feat, so the
+        # specialized getter and setter are chosen here once instead of
+        # branching on isinstance on every call. The closures shadow the
+        # generic local_get/local_set methods below.
+        if self.get_cmd:
+            if isinstance(self.get_cmd, str):
+                def local_get(instance, _cmd=self.get_cmd):
+                    return instance.get_query(_cmd)
+            else:
+                msg, ans = self.get_cmd
+
+                def local_get(instance, _msg=msg, _ans=ans):
+                    return instance.parse_query(_msg, format=_ans)
+
+            self.local_get = local_get
+
+        if self.set_cmd:
+            self._set_fmt = _compile_value_format(self.set_cmd)
+
+            def local_set(instance, value, _fmt=self._set_fmt):
+                return instance.set_query(_fmt(value))
+
+            self.local_set = local_set
+
         kwargs = self._build_feat_kwargs(owner, name)
         self._check_format_string()
-        Feat.__init__(self, **kwargs)
-        Feat.__set_name__(self, owner, name)
+        Feat._init_after_naming(self, owner, name, **kwargs)
 
     def local_get(self, instance):
         if isinstance(self.get_cmd, str):
@@ -82,7 +213,7 @@ class MFeatMixin:
             return instance.parse_query(msg, format=ans)
 
     def local_set(self, instance, value):
-        return instance.set_query(self.set_cmd.format(value))
+        return instance.set_query(self._set_fmt(value))
 
     def _check_values(self, format_string):
         """Implement to check if the value part of formatting string is valid.
@@ -116,23 +247,46 @@ class DictMFeatMixin(MFeatMixin):
         self.keys = keys
 
     def __set_name__(self, owner, name):
+        # See MFeatMixin.__set_name__: the dispatch on the command type
+        # is resolved once here.
+        if self.get_cmd:
+            if isinstance(self.get_cmd, str):
+                self._get_fmt = _compile_key_value_format(self.get_cmd)
+
+                def local_get(instance, key, _fmt=self._get_fmt):
+                    return instance.get_query(_fmt(key, None))
+            else:
+                msg, ans = self.get_cmd
+
+                def local_get(instance, key, _msg=msg, _ans=ans):
+                    return instance.parse_query(_msg, format=_ans)
+
+            self.local_get = local_get
+
+        if self.set_cmd:
+            self._set_fmt = _compile_key_value_format(self.set_cmd)
+
+            def local_set(instance, key, value, _fmt=self._set_fmt):
+                return instance.set_query(_fmt(key, value))
+
+            self.local_set = local_set
+
         kwargs = self._build_feat_kwargs(owner, name)
         self._check_format_string()
-        DictFeat.__init__(self, **kwargs)
-        DictFeat.__set_name__(self, owner, name)
+        DictFeat._init_after_naming(self, owner, name, **kwargs)
 
     def _check_values(self, spec):
         raise NotImplementedError
 
     def local_get(self, instance, key):
         if isinstance(self.get_cmd, str):
-            return instance.get_query(self.get_cmd.format(key=key))
+            return instance.get_query(self._get_fmt(key, None))
         else:
             msg, ans = self.get_cmd
             return instance.parse_query(msg, format=ans)
 
     def local_set(self, instance, key, value):
-        return instance.set_query(self.set_cmd.format(key=key, value=value))
+        return instance.set_query(self._set_fmt(key, value))
 
     def _check_format_string(self):
         keys = self.keys
@@ -161,11 +315,13 @@ class DictMFeatMixin(MFeatMixin):
     def _build_feat_kwargs(self, owner, name):
         """Builds the kwargs to be delivered to the DictFeat constructor.
         """
-        return {'keys': self.keys, **super()._build_feat_kwargs(owner, name)}
+        kwargs = super()._build_feat_kwargs(owner, name)
+        kwargs['keys'] = self.keys
+        return kwargs
 
     def get_initial_value(self):
         if self.keys:
-            return {k: self._get_initial_value() for k in self.keys}
+            return _KeyedDefaultDict(self._get_initial_value, self.keys)
         return collections.defaultdict(self._get_initial_value)
 
 
@@ -195,8 +351,9 @@ class BoolMixin:
 
             self.__false_value = owner.DRIVER_FALSE
 
-        return dict(values={True: self.__true_value, False: self.__false_value},
-                    **super()._build_feat_kwargs(owner, name))
+        kwargs = super()._build_feat_kwargs(owner, name)
+        kwargs['values'] = {True: self.__true_value, False: self.__false_value}
+        return kwargs
 
     def _check_values(self, format_string):
 
@@ -243,16 +400,18 @@ class NumericMixin:
         self.__limits = limits
 
     def _build_feat_kwargs(self, owner, name):
-        return dict(limits= self.__limits,
-                    **super()._build_feat_kwargs(owner, name))
+        kwargs = super()._build_feat_kwargs(owner, name)
+        kwargs['limits'] = self.__limits
+        return kwargs
 
 class IntMixin(NumericMixin):
     """Mixin class for Int Feats
     """
 
     def _build_feat_kwargs(self, owner, name):
-        return dict(get_funcs=(int, ),
-                    **super()._build_feat_kwargs(owner, name))
+        kwargs = super()._build_feat_kwargs(owner, name)
+        kwargs['get_funcs'] = (int, )
+        return kwargs
 
     def _get_initial_value(self):
         return 0
@@ -266,8 +425,9 @@ class FloatMixin(NumericMixin):
     """
 
     def _build_feat_kwargs(self, owner, name):
-        return dict(get_funcs=(float, ),
-                    **super()._build_feat_kwargs(owner, name))
+        kwargs = super()._build_feat_kwargs(owner, name)
+        kwargs['get_funcs'] = (float, )
+        return kwargs
 
     def _get_initial_value(self):
         return 0.0
@@ -286,8 +446,10 @@ class QuantityMixin:
         self._internal_type = float
 
     def _build_feat_kwargs(self, owner, name):
-        return dict(units=self.__units, limits= self.__limits,
-                    **super()._build_feat_kwargs(owner, name))
+        kwargs = super()._build_feat_kwargs(owner, name)
+        kwargs['units'] = self.__units
+        kwargs['limits'] = self.__limits
+        return kwargs
 
     def _check_values(self, format_string):
         pass
@@ -360,8 +522,9 @@ class ValuesMixin:
         check_values(format_string, values, 'set_cmd')
 
     def _build_feat_kwargs(self, owner, name):
-        return dict(values=self.__values,
-                    **super()._build_feat_kwargs(owner, name))
+        kwargs = super()._build_feat_kwargs(owner, name)
+        kwargs['values'] = self.__values
+        return kwargs
 
     def get_initial_value(self):
         values = self.__values
@@ -394,17 +557,26 @@ class ValuesDictFeat(ValuesMixin, DictMFeatMixin, DictFeat):
         check_values(format_string, values, 'set_cmd')
 
 
+@functools.lru_cache(maxsize=None)
+def _enum_values_dict(enum_cls):
+    """Values dict for an enum class, keyed by both the members and
+    their names. Shared by every feat using the same enum; it is only
+    ever read by the processors.
+    """
+    values = {}
+    for name, member in enum_cls.__members__.items():
+        values[member] = member.value
+        values[name] = member.value
+    return values
+
+
 class EnumFeat(ValuesFeat):
 
     def __init__(self, get_cmd, set_cmd, enum_cls):
-        values = {v: v.value for k, v in enum_cls.__members__.items()}
-        values.update({k: v.value for k, v in enum_cls.__members__.items()})
-        ValuesFeat.__init__(self, get_cmd, set_cmd, values)
+        ValuesFeat.__init__(self, get_cmd, set_cmd, _enum_values_dict(enum_cls))
 
 
 class EnumDictFeat(ValuesDictFeat):
 
     def __init__(self, get_cmd, set_cmd, enum_cls, keys=None):
-        values = {v: v.value for k, v in enum_cls.__members__.items()}
-        values.update({k: v.value for k, v in enum_cls.__members__.items()})
-        ValuesDictFeat.__init__(self, get_cmd, set_cmd, values, keys)
+        ValuesDictFeat.__init__(self, get_cmd, set_cmd, _enum_values_dict(enum_cls), keys)
@@ -17,6 +17,9 @@ from . import Q_
 from .log import LOGGER as _LOG
 from stringparser import Parser
 
+#: Parser compiles a regex per spec; share instances per distinct spec.
+_compiled_parser = functools.lru_cache(maxsize=256)(Parser)
+
 
 class DimensionalityWarning(Warning):
     """ """
@@ -29,6 +32,13 @@ def noop(value):
     return value
 
 
+@functools.lru_cache(maxsize=256)
+def _resolve_units(units):
+    """Parse a unit string through the registry once per distinct spec.
+    """
+    return Q_(1, units)
+
+
 def convert_to(units, on_dimensionless='warn', on_incompatible='raise',
                return_float=False, logger=_LOG):
     """Convert a Quantity to other units.
@@ -75,31 +85,69 @@ def convert_to(units, on_dimensionless='warn', on_incompatible='raise',
                          "It should be either 'ignore', 'warn' or 'raise'".format(on_dimensionless))
 
     if isinstance(units, str):
-        units = Q_(1, units)
+        units = _resolve_units(units)
     elif not isinstance(units, Q_):
         raise ValueError("{} is not a valid value for 'units'. "
                          "It should be either str or Quantity".format(units))
 
+    # The policy strings are evaluated once here so the closures below
+    # branch on plain booleans instead of comparing strings per call.
+    raise_dimensionless = on_dimensionless == 'raise'
+    warn_dimensionless = on_dimensionless == 'warn'
+    raise_incompatible = on_incompatible == 'raise'
+    warn_incompatible = on_incompatible == 'warn'
+
     if return_float:
+        # Conversion factors per source units. Conversions that map zero
+        # to zero are plain scalings and can be replayed as one multiply;
+        # offset units (e.g. degC) are marked with False and always go
+        # through Pint.
+        factor_cache = {}
+
+        # Single-slot inline cache for the last seen source units: the
+        # typical driver always reports the same units, and an identity
+        # check is cheaper than hashing a UnitsContainer.
+        last_units = None
+        last_factor = None
+
         def _inner(value):
+            nonlocal last_units, last_factor
             if isinstance(value, Q_):
+                if value._units is last_units:
+                    return value._magnitude * last_factor
+                factor = factor_cache.get(value._units)
+                if factor:
+                    last_units = value._units
+                    last_factor = factor
+                    return value._magnitude * factor
                 try:
-                    return value.to(units).magnitude
+                    converted = value.to(units).magnitude
                 except ValueError as e:
-                    if on_incompatible == 'raise':
+                    if raise_incompatible:
                         raise ValueError(e)
-                    elif on_incompatible == 'warn':
+                    elif warn_incompatible:
                         msg = 'Unable to convert {} to {}. Ignoring source units.'.format(value, units)
                         warnings.warn(msg, DimensionalityWarning)
                         logger.warning(msg)
 
-                # on_incompatible == 'ignore'
-                return value.magnitude
+                    # on_incompatible == 'ignore'
+                    return value.magnitude
+
+                if factor is None:
+                    try:
+                        if Q_(0, value._units).to(units).magnitude == 0:
+                            factor_cache[value._units] = Q_(1, value._units).to(units).magnitude
+                        else:
+                            factor_cache[value._units] = False
+                    except Exception:
+                        factor_cache[value._units] = False
+
+                return converted
             else:
                 if not units.dimensionless:
-                    if on_dimensionless == 'raise':
+                    if raise_dimensionless:
                         raise ValueError('Unable to convert {} to {}'.format(value, units))
-                    elif on_dimensionless == 'warn':
+                    elif warn_dimensionless:
                         msg = 'Assuming units `{1.units}` for {0}'.format(value, units)
                         warnings.warn(msg, DimensionalityWarning)
                         logger.warning(msg)
@@ -110,12 +158,14 @@ def convert_to(units, on_dimensionless='warn', on_incompatible='raise',
     else:
         def _inner(value):
             if isinstance(value, Q_):
+                if value._units == units._units:
+                    return value
                 try:
                     return value.to(units)
                 except ValueError as e:
-                    if on_incompatible == 'raise':
+                    if raise_incompatible:
                         raise ValueError(e)
-                    elif on_incompatible == 'warn':
+                    elif warn_incompatible:
                         msg = 'Assuming units `{1.units}` for {0}'.format(value, units)
                         warnings.warn(msg, DimensionalityWarning)
                         logger.warning(msg)
@@ -124,9 +174,9 @@ def convert_to(units, on_dimensionless='warn', on_incompatible='raise',
                 return Q_(float(value.magnitude), units)
             else:
                 if not units.dimensionless:
-                    if on_dimensionless == 'raise':
+                    if raise_dimensionless:
                         raise ValueError('Unable to convert {} to {}'.format(value, units))
-                    elif on_dimensionless == 'warn':
+                    elif warn_dimensionless:
                         msg = 'Assuming units `{1.units}` for {0}'.format(value, units)
                         warnings.warn(msg, DimensionalityWarning)
                         logger.warning(msg)
@@ -168,14 +218,93 @@ def range_checker_coercer(low, high, step=None):
     (1, 5, 10)
     """
 
-    def _inner(value):
+    try:
+        return _build_range_checker(low, high, step)
+    except TypeError:
+        # Unhashable bounds cannot go through the cache.
+        return _make_range_checker(low, high, step)
+
+
+def _make_range_checker(low, high, step):
+    # The step branch is resolved here, and the bounds are baked in as
+    # default arguments (the fastest lookup CPython offers) so the
+    # per-call body is a single comparison.
+    if step:
+        def _inner(value, low=low, high=high, step=step):
+            if not (low <= value <= high):
+                raise ValueError('{} not in range ({}, {})'.format(value, low, high))
+            return round((value - low) / step) * step + low
+    else:
+        def _inner(value, low=low, high=high):
+            if not (low <= value <= high):
+                raise ValueError('{} not in range ({}, {})'.format(value, low, high))
+            return value
+
+    return _inner
+
+
+_build_range_checker = functools.lru_cache(maxsize=256)(_make_range_checker)
+
+
+def bulk_range_checker(low, high, step=None):
+    """Callable that validates every element of a sequence/array in one call.
+
+    Useful as an Action `funcs` entry for methods that receive whole
+    waveforms, where a per-element Python closure would pay one
+    interpreter round-trip per point. When numba is installed (it is an
+    optional accelerator, not a Lantz dependency) the bounds check is
+    JIT compiled and cached; otherwise a plain Python loop is used.
+
+    The callable raises a ValueError if any value is not in range.
+
+    Parameters
+    ----------
+    low : int or float
+        Lower value in the range (included)
+    high : int or float
+        Higher value in the range (included)
+    step : int or float
+        Coercion grid. Only supported by the pure Python fallback.
+
+    Returns
+    -------
+    callable (values) -> (values) might raise ValueError
+    """
+
+    try:
+        from numba import njit
+    except ImportError:
+        njit = None
+
+    if njit is not None and not step:
+
+        @njit(cache=True)
+        def _in_range(values):
+            for value in values:
+                if not (low <= value <= high):
+                    return False
+            return True
+
+        def _inner(values):
+            if not _in_range(values):
+                raise ValueError('Not all values in range ({}, {})'.format(low, high))
+            return values
+
+    elif step:
+        scalar = range_checker_coercer(low, high, step)
+
+        def _inner(values):
+            return tuple(scalar(value) for value in values)
 
-        if not (low <= value <= high):
-            raise ValueError('{} not in range ({}, {})'.format(value, low, high))
-        if step:
-            value = round((value - low) / step) * step + low
-        return value
+    else:
+        scalar = range_checker_coercer(low, high)
+
+        def _inner(values):
+            for value in values:
+                scalar(value)
+            return values
 
+    _inner.accepts_tuples = True
     return _inner
 
 
@@ -203,11 +332,32 @@ def membership_checker(container):
     ValueError: 0 not in (1, 2, 3)
     """
 
-    def _inner(value):
+    # Tuples and lists of hashable values are tested through a frozenset
+    # (O(1) instead of a linear scan); the original container is kept
+    # only for the error message.
+    lookup = container
+    if isinstance(container, (tuple, list)):
+        try:
+            lookup = frozenset(container)
+        except TypeError:
+            pass
+
+    if lookup is not container:
+        def _inner(value):
+            try:
+                present = value in lookup
+            except TypeError:
+                # unhashable probe value: fall back to the linear scan
+                present = value in container
+            if not present:
+                raise ValueError('{!r} not in {}'.format(value, container))
+            return value
+    else:
+        def _inner(value):
 
-        if value not in container:
-            raise ValueError('{!r} not in {}'.format(value, container))
-        return value
+            if value not in container:
+                raise ValueError('{!r} not in {}'.format(value, container))
+            return value
 
     return _inner
 
@@ -237,10 +387,15 @@ def mapper(container):
     ValueError: 0 not in ('A', 'B')
     """
 
+    keys = None
+
     def _inner(key):
+        nonlocal keys
 
         if key not in container:
-            raise ValueError("{!r} not in {}".format(key, tuple(container.keys())))
+            if keys is None:
+                keys = tuple(container.keys())
+            raise ValueError("{!r} not in {}".format(key, keys))
         return container[key]
 
     return _inner
@@ -273,20 +428,18 @@ def enum_mapper(container):
     ValueError: 'B' not in MyEnum
     """
 
-    def _inner(key):
-
-        if isinstance(key, enum.Enum):
-            return key.value
+    # Jump table indexed by both the member and its name, replacing the
+    # isinstance dispatch with a single dict probe per call.
+    table = {}
+    for name, member in container.__members__.items():
+        table[name] = member.value
+        table[member] = member.value
 
-        elif isinstance(key, str):
-            try:
-                key = container[key]
-            except KeyError:
-                raise ValueError("{!r} not in {!r}".format(key, container))
-
-            return key.value
+    def _inner(key):
 
-        else:
+        try:
+            return table[key]
+        except (KeyError, TypeError):
             raise ValueError("{!r} not in {!r}".format(key, container))
 
     return _inner
@@ -314,6 +467,12 @@ def to_converter(func):
     (6, 15)
     """
 
+    #: spec -> built converter, so identical specs recurring across
+    #: feats and actions share one closure. Unhashable containers are
+    #: keyed by id; the entry keeps a strong reference to the container,
+    #: so its id cannot be recycled while the entry exists.
+    cache = {}
+
     def conv(f, s):
         if callable(s):
             return s
@@ -321,7 +480,21 @@ def to_converter(func):
         if f is None or s is None:
             return noop
 
-        return f(s)
+        try:
+            key = ('h', s)
+            cached = cache.get(key)
+        except TypeError:
+            key = ('i', id(s))
+            cached = cache.get(key)
+            if cached is not None and cached[0] is not s:
+                cached = None
+
+        if cached is not None:
+            return cached[1]
+
+        out = f(s)
+        cache[key] = (s, out)
+        return out
 
     @functools.wraps(func)
     def _inner(specs):
@@ -434,11 +607,14 @@ def parser(spec):
     """
 
     if isinstance(spec, str):
-        return Parser(spec)
+        return _compiled_parser(spec)
     raise TypeError('parser argument must be a string, '
                     'not {}'.format(spec))
 
 
+parser.cache_clear = _compiled_parser.cache_clear
+
+
 @to_converter
 def mapper_or_checker(container):
     """Callable to map the function parameter values.
@@ -489,9 +665,8 @@ def reverse_mapper_or_checker(container):
     True
     """
 
-    #: Shared cache of reversed dictionaries indexed by the id()
-    __reversed_cache = {}
-
+    # Reversed dictionaries are shared through the to_converter cache,
+    # which keys on the original container.
     if isinstance(container, dict):
         return mapper({value: key for key, value in container.items()})
     if isinstance(container, set):
@@ -550,39 +725,73 @@ def range_checker(spec):
     return range_checker_coercer(spec.start, spec.stop, spec.step)
 
 
+def fuse(funcs):
+    """Fuse a sequence of single-argument callables into one callable
+    that applies them from left to right.
+
+    The chain is compiled into a single function (the same exec trick
+    used by the stdlib dataclasses module) so calling it costs one frame
+    instead of one frame plus an iteration per step.
+    """
+
+    funcs = tuple(funcs)
+
+    if not funcs:
+        return noop
+
+    if len(funcs) == 1:
+        return funcs[0]
+
+    namespace = {'f%d' % ndx: func for ndx, func in enumerate(funcs)}
+    body = '\n'.join('    v = f%d(v)' % ndx for ndx in range(len(funcs)))
+    exec('def _chain(v):\n%s\n    return v' % body, namespace)
+    return namespace['_chain']
+
+
 class Processor:
 
     def __init__(self, *funcs):
         self._funcs = tuple(funcs)
+        self._recompile()
 
-    def __call__(self, value):
-        if isinstance(value, tuple):
-            return self._call_tuple(value)
+    def _recompile(self):
+        self._compiled = fuse(self._funcs)
 
+        # The tuple path resolves the per-func accepts_tuples protocol
+        # here instead of on every call.
+        steps = []
         for func in self._funcs:
-            value = func(value)
+            if getattr(func, 'accepts_tuples', False):
+                steps.append(func)
+            else:
+                def _map(values, _f=func):
+                    return tuple(map(_f, values))
+                steps.append(_map)
+        self._compiled_tuple = fuse(steps)
+
+    def __call__(self, value):
+        # `type is` skips the subclass walk; values passed as tuples are
+        # built by lantz itself and are always plain tuples.
+        if type(value) is tuple:
+            return self._compiled_tuple(value)
 
-        return value
+        return self._compiled(value)
 
     def __bool__(self):
         return bool(self._funcs)
 
     def _call_tuple(self, values):
-        for func in self._funcs:
-            if getattr(func, 'accepts_tuples', False):
-                values = func(values)
-            else:
-                values = tuple(func(v) for v in values)
-
-        return values
+        return self._compiled_tuple(values)
 
     def prepend(self, func):
         assert callable(func) or isinstance(func, tuple)
         self._funcs = (func, ) + self._funcs
+        self._recompile()
 
     def append(self, func):
         assert callable(func) or isinstance(func, tuple)
         self._funcs = self._funcs + (func, )
+        self._recompile()
 
     def __reversed__(self):
         return self.__class__(*reversed(self._funcs))
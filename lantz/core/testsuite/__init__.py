@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
+import collections
 import contextlib
+import functools
 import logging
 import os
 import unittest
@@ -27,48 +29,71 @@ class Msg:
 @contextlib.contextmanager
 def must_warn(warning, count):
     msg = Msg()
-    with warnings.catch_warnings(record=True) as ws:
-        # Catch all warnings of this type
+    with warnings.catch_warnings():
+        # Catch all warnings of this type, silence the rest.
+        warnings.simplefilter('ignore')
         warnings.simplefilter('always', warning)
 
+        # Counting through showwarning keeps memory bounded: only the
+        # last record is retained (for re-display on mismatch) instead
+        # of the full list that record=True accumulates.
+        seen = [0]
+        last = [None]
+
+        def _showwarning(message, category, filename, lineno, file=None, line=None):
+            seen[0] += 1
+            last[0] = (message, category, filename, lineno, file, line)
+
+        warnings.showwarning = _showwarning
+
         # Execute the function
         yield msg
 
-    # If we are looking for a specific amount of
-    # warnings, re-send all warnings if not the same
-    if count is not None and count != len(ws):
-        for w in ws:
-            warnings.showwarning(
-                message=w.message,
-                category=w.category,
-                filename=w.filename,
-                lineno=w.lineno,
-                file=w.file,
-                line=w.line,
-            )
-
-    if count > len(ws):
-        msg.set('More %s than expected (%d > %d)' % (warning, count, len(ws)))
-    elif count < len(ws):
-        msg.set('Less %s than expected (%d < %d)' % (warning, count, len(ws)))
+    if count > seen[0]:
+        msg.set('More %s than expected (%d > %d)' % (warning, count, seen[0]))
+    elif count < seen[0]:
+        msg.set('Less %s than expected (%d < %d)' % (warning, count, seen[0]))
+        if last[0] is not None:
+            warnings.showwarning(*last[0])
 
 
 class MemHandler(logging.Handler):
 
     def __init__(self):
         super().__init__()
-        self.setFormatter(logging.Formatter(style='{'))
-        self.history = list()
+        # deque: O(1) appends without list reallocation for the
+        # append-heavy logging workload.
+        self.history = collections.deque()
 
     def emit(self, record):
-        self.history.append(self.format(record))
+        # The tests only compare against the plain message text, so the
+        # full Formatter pipeline is skipped.
+        self.history.append(record.getMessage())
+
+
+
+def _iter_tests(suite):
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_tests(test)
+        else:
+            yield test
+
 
+@functools.lru_cache(maxsize=1)
+def _discovered():
+    # Discovery walks the package and imports every test module; the
+    # flattened test cases are cached so repeated testsuite() calls in
+    # an interactive session pay for it once.
+    return tuple(_iter_tests(unittest.TestLoader().discover(os.path.dirname(__file__))))
 
 
 def testsuite():
     """A testsuite that has all the lantz tests.
     """
-    return unittest.TestLoader().discover(os.path.dirname(__file__))
+    # A fresh TestSuite per call: suites drop their tests as they run,
+    # so the cached cases cannot be handed out inside a reused suite.
+    return unittest.TestSuite(_discovered())
 
 
 def main():
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""Shared quantity comparison helper for the testsuite."""
+
+from lantz.core import Q_, ureg
+
+
+# Modified from python quantities test suite
+def assert_quantity_equal(q1, q2, msg=None, delta=None):
+    """Make sure q1 and q2 are the same quantities to within the given
+    precision.
+    """
+
+    if isinstance(q1, (list, tuple)):
+        for first, second in zip(q1, q2):
+            assert_quantity_equal(first, second)
+        return
+
+    delta = 1e-5 if delta is None else delta
+    msg = '' if msg is None else ' (%s)' % msg
+
+    # Quantities pass through untouched: Q_ re-parses units even for
+    # values that already are quantities.
+    q1 = q1 if isinstance(q1, ureg.Quantity) else Q_(q1)
+    q2 = q2 if isinstance(q2, ureg.Quantity) else Q_(q2)
+
+    d1 = getattr(q1, '_dimensionality', None)
+    d2 = getattr(q2, '_dimensionality', None)
+    if d1 is not d2 and (d1 or d2) and not (d1 == d2):
+        raise AssertionError(
+            "Dimensionalities are not equal (%s vs %s)%s" % (d1, d2, msg)
+            )
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""Shared driver fixtures.
+
+Building a Driver subclass is the expensive part of most tests here
+(descriptor install, registries, logger wiring), so the common shapes
+are built once per module and the tests only instantiate them.
+Instances keep their own `_eggs` dict, so tests cannot leak state into
+each other through the shared class.
+"""
+
+import logging
+
+import pytest
+
+from lantz.core import Driver, DictFeat, mfeats
+from lantz.core.log import get_logger
+from lantz.core.testsuite import MemHandler
+
+
+@pytest.fixture
+def mem_logger():
+    # One handler added and removed per test: re-adding fresh handlers
+    # without removal accumulates them on the module-level logger for
+    # the rest of the process.
+    hdl = MemHandler()
+    logger = get_logger('lantz.driver')
+    logger.addHandler(hdl)
+    logger.setLevel(logging.DEBUG)
+    yield hdl
+    logger.removeHandler(hdl)
+    hdl.history.clear()
+
+
+class FakeMBDriver(Driver):
+
+    def __init__(self):
+        super().__init__()
+        self.internal = dict(eggs=0)
+
+    def query(self, msg):
+        if msg == 'eggs?':
+            return self.internal['eggs']
+        elif msg == 'eggs 0':
+            self.internal['eggs'] = 0
+        elif msg == 'eggs 1':
+            self.internal['eggs'] = 1
+        else:
+            raise ValueError
+
+    get_query = query
+    set_query = query
+
+
+def _spam_ro():
+
+    class Spam(Driver):
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._eggs = {'answer': 42}
+
+        @DictFeat()
+        def eggs(self_, key):
+            return self_._eggs[key]
+
+    return Spam
+
+
+def _spam_wo():
+
+    # noinspection PyPropertyDefinition
+    class Spam(Driver):
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._eggs = {'answer': 42}
+
+        eggs = DictFeat()
+
+        @eggs.setter
+        def eggs(self_, key, value):
+            self_._eggs[key] = value
+
+    return Spam
+
+
+def _spam_rw():
+
+    # noinspection PyPropertyDefinition
+    class Spam(Driver):
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._eggs = {'answer': 42}
+
+        @DictFeat()
+        def eggs(self_, key):
+            return self_._eggs[key]
+
+        @eggs.setter
+        def eggs(self_, key, value):
+            self_._eggs[key] = value
+
+    return Spam
+
+
+@pytest.fixture(scope='session')
+def spam_by_mode():
+    # One class per access mode for the whole session; the parametrized
+    # access test picks from here.
+    return {'ro': _spam_ro(), 'wo': _spam_wo(), 'rw': _spam_rw()}
+
+
+@pytest.fixture(scope='module')
+def SpamRW():
+    return _spam_rw()
+
+
+@pytest.fixture
+def SpamRWFresh():
+    # Function scoped: the subproperties a DictFeat accumulates for the
+    # keys already accessed are class state and show up in recall(), so
+    # tests asserting on a pristine cache need their own class.
+    return _spam_rw()
+
+
+@pytest.fixture(scope='module')
+def SpamUnits():
+
+    class Spam(Driver):
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._eggs = {'answer': 42}
+
+        @DictFeat(units='s')
+        def eggs(self_, key):
+            return self_._eggs[key]
+
+        @eggs.setter
+        def eggs(self_, key, value):
+            self_._eggs[key] = value
+
+    return Spam
+
+
+@pytest.fixture(scope='module')
+def SpamKeys():
+
+    class Spam(Driver):
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._eggs = {'answer': 42}
+
+        @DictFeat(keys=('answer', ))
+        def eggs(self_, key):
+            return self_._eggs[key]
+
+        @eggs.setter
+        def eggs(self_, key, value):
+            self_._eggs[key] = value
+
+    return Spam
+
+
+@pytest.fixture(scope='module')
+def SpamKeysMapping():
+
+    class Spam(Driver):
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._eggs = {'answer': 42}
+
+        @DictFeat(keys={28: 'answer'})
+        def eggs(self_, key):
+            return self_._eggs[key]
+
+        @eggs.setter
+        def eggs(self_, key, value):
+            self_._eggs[key] = value
+
+    return Spam
+
+
+@pytest.fixture(scope='module')
+def SpamNumericKeys():
+
+    class Spam(Driver):
+
+        def __init__(self_):
+            super().__init__()
+            self_._eggs = {1: 9}
+
+        @DictFeat()
+        def eggs(self_, key):
+            return self_._eggs[key]
+
+        @eggs.setter
+        def eggs(self_, key, value):
+            self_._eggs[key] = value
+
+    return Spam
+
+
+@pytest.fixture(scope='module')
+def SpamUnitsKeys():
+
+    class Spam(Driver):
+
+        @DictFeat(keys=(1, 2, 3), units='ms')
+        def eggs(self_, key):
+            return 9
+
+    return Spam
+
+
+@pytest.fixture(scope='session')
+def BoolFeatSpam():
+
+    class Spam(FakeMBDriver):
+
+        eggs = mfeats.BoolFeat('eggs?', 'eggs {:d}', 1, 0)
+
+    return Spam
+
+
+@pytest.fixture(scope='session')
+def BoolFeatDriverValuesSpam():
+
+    class Spam(FakeMBDriver):
+
+        DRIVER_TRUE = 1
+        DRIVER_FALSE = 0
+
+        eggs = mfeats.BoolFeat('eggs?', 'eggs {:d}')
+
+    return Spam
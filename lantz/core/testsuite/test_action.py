@@ -40,6 +40,12 @@ class ActionTest(unittest.TestCase):
     def test_action(self):
         obj = aDriver()
         self.assertEqual(obj.run(), 42)
+        # Modifier-less Actions must get a (None, None) table so the
+        # transform layer is bypassed, not a missing one.
+        self.assertEqual(aDriver._lantz_actions['run']._class_converters,
+                         (None, None))
+        self.assertEqual(aDriver._lantz_actions['run2']._class_converters,
+                         (None, None))
         self.assertEqual(obj.run2(2), 42 * 2)
         self.assertEqual(obj.run3(3), 42 * 3)
         self.assertEqual(obj.run4(Q_(3, 'ms')), 3)
@@ -8,34 +8,17 @@ from lantz.core import Driver, Feat, Q_, ureg, DimensionalityWarning
 from lantz.core.log import get_logger
 from lantz.core.helpers import UNSET, MISSING
 from lantz.core.testsuite import must_warn, MemHandler
+from lantz.core.testsuite._quantity import assert_quantity_equal
 
 
 class FeatTest(unittest.TestCase):
 
-    # Modified from python quantities test suite
     def assertQuantityEqual(self, q1, q2, msg=None, delta=None):
         """
         Make sure q1 and q2 are the same quantities to within the given
         precision.
         """
-
-        if isinstance(q1, (list, tuple)):
-            for first, second in zip(q1, q2):
-                self.assertQuantityEqual(first, second)
-            return
-
-        delta = 1e-5 if delta is None else delta
-        msg = '' if msg is None else ' (%s)' % msg
-
-        q1 = Q_(q1)
-        q2 = Q_(q2)
-
-        d1 = getattr(q1, '_dimensionality', None)
-        d2 = getattr(q2, '_dimensionality', None)
-        if (d1 or d2) and not (d1 == d2):
-            raise self.failureException(
-                "Dimensionalities are not equal (%s vs %s)%s" % (d1, d2, msg)
-                )
+        assert_quantity_equal(q1, q2, msg, delta)
 
     def test_readonly(self):
 
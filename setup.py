@@ -1,21 +1,21 @@
-from setuptools import setup
-import codecs
+from pathlib import Path
 
+from setuptools import setup
 
-def read(filename):
-    return codecs.open(filename, encoding='utf-8').read()
 
+def long_description():
+    # read_text closes the file handle, unlike the previous
+    # codecs.open(...).read() chain.
+    return '\n\n'.join(Path(name).read_text(encoding='utf-8')
+                       for name in ('README', 'AUTHORS', 'CHANGES'))
 
-long_description = '\n\n'.join([read('README'),
-                                read('AUTHORS'),
-                                read('CHANGES')])
 
 setup(
     name='lantzdev',
     version='0.6.2',
     license='BSD 3-Clause License',
     description='Simple yet powerful instrumentation in Python',
-    long_description=long_description,
+    long_description=long_description(),
     long_description_content_type='text/markdown',
     url='https://github.com/lantzproject/lantz',
     author='Hernan E. Grecco',